@@ -8,82 +8,125 @@ cache, and logs, while monitoring disk space and optimizing system performance.
 
 import os
 import sys
+import errno
 import shutil
-import subprocess
 import logging
+import logging.handlers
 import argparse
+import stat
+import threading
 import time
+import types
 import psutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 
-# Configure logging
+# Optional io_uring backend for batched deletions (pip3 install liburing)
+try:
+    import liburing
+except ImportError:
+    liburing = None
+
+# Optional vectorized mtime filtering during scans (pip3 install numpy)
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Configure logging; file writes go through a MemoryHandler so records are
+# flushed in batches of 1024 (immediately on ERROR, and at shutdown) instead
+# of one synchronous write per record
+_LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+_file_handler = logging.FileHandler("system_cleanup.log")
+_file_handler.setFormatter(logging.Formatter(_LOG_FORMAT))
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
+    format=_LOG_FORMAT,
     handlers=[
-        logging.FileHandler("system_cleanup.log"),
+        logging.handlers.MemoryHandler(
+            capacity=1024, flushLevel=logging.ERROR, target=_file_handler),
         logging.StreamHandler()
     ]
 )
 logger = logging.getLogger(__name__)
 
-# Default locations for cleanup
-DEFAULT_CLEANUP_PATHS = {
+# Home directory resolved once at import; expanduser may hit pwd.getpwuid
+# each time it runs
+_HOME = os.path.expanduser("~")
+
+# Default locations for cleanup; wrapped read-only so callers can't mutate
+# the shared defaults
+DEFAULT_CLEANUP_PATHS = types.MappingProxyType({
     "temp_files": [
         "/tmp",
         "/var/tmp",
-        os.path.expanduser("~/.cache"),
-        os.path.expanduser("~/Downloads"),
+        f"{_HOME}/.cache",
+        f"{_HOME}/Downloads",
     ],
     "log_files": [
         "/var/log",
     ],
     "cache_files": [
-        os.path.expanduser("~/.cache/thumbnails"),
-        os.path.expanduser("~/.cache/mozilla"),
-        os.path.expanduser("~/.cache/google-chrome"),
+        f"{_HOME}/.cache/thumbnails",
+        f"{_HOME}/.cache/mozilla",
+        f"{_HOME}/.cache/google-chrome",
     ]
-}
+})
 
-# File extensions to target for cleanup
+# File extensions to target for cleanup, as tuples so they can be handed
+# straight to str.endswith (its C implementation checks all suffixes)
 TARGET_EXTENSIONS = {
-    "temp": [".tmp", ".temp", ".swp", ".bak", ".old"],
-    "logs": [".log", ".log.1", ".log.gz"],
-    "cache": [".cache"]
+    "temp": (".tmp", ".temp", ".swp", ".bak", ".old"),
+    "logs": (".log", ".log.1", ".log.gz"),
+    "cache": (".cache",)
 }
 
 # Disk space threshold (in percentage)
 DISK_THRESHOLD = 80
 
+# Worker threads for parallel scanning/deletion (both syscall-latency-bound)
+DEFAULT_THREADS = 16
 
-def get_size(path):
-    """Calculate the total size of a directory or file."""
+
+def _dir_size(path):
+    """Recursively sum regular-file sizes under a directory via scandir."""
     total_size = 0
-    if os.path.isfile(path):
-        return os.path.getsize(path)
-    
-    for dirpath, dirnames, filenames in os.walk(path):
-        for f in filenames:
-            fp = os.path.join(dirpath, f)
-            if os.path.exists(fp) and not os.path.islink(fp):
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
                 try:
-                    total_size += os.path.getsize(fp)
+                    if entry.is_dir(follow_symlinks=False):
+                        total_size += _dir_size(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        # One lstat per file, served from the getdents cache
+                        total_size += entry.stat(follow_symlinks=False).st_size
                 except (OSError, FileNotFoundError):
                     pass
+    except (PermissionError, OSError) as e:
+        logger.debug(f"Error scanning directory {path}: {e}")
     return total_size
 
 
+def get_size(path):
+    """Calculate the total size of a directory or file."""
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    return _dir_size(path)
+
+
+_SIZE_NAMES = ("B", "KB", "MB", "GB", "TB")
+
+
 def format_size(size_bytes):
     """Format size in bytes to a human-readable format."""
-    if size_bytes == 0:
+    size_bytes = int(size_bytes)
+    if size_bytes <= 0:
         return "0B"
-    size_names = ("B", "KB", "MB", "GB", "TB")
-    i = 0
-    while size_bytes >= 1024 and i < len(size_names) - 1:
-        size_bytes /= 1024
-        i += 1
-    return f"{size_bytes:.2f} {size_names[i]}"
+    # bit_length // 10 is floor(log1024), picking the unit without a loop
+    i = min(len(_SIZE_NAMES) - 1, (size_bytes.bit_length() - 1) // 10)
+    return f"{size_bytes / (1 << (10 * i)):.2f} {_SIZE_NAMES[i]}"
 
 
 def check_disk_space():
@@ -97,122 +140,462 @@ def check_disk_space():
     return percent_used > DISK_THRESHOLD
 
 
-def get_files_to_delete(paths, age_days=7, extensions=None, exclude_dirs=None):
+# Cap on cached directory fds; directories past the cap fall back to full paths
+MAX_DIR_FDS = 512
+
+_dir_fds = {}
+_dir_fds_lock = threading.Lock()
+
+
+def _dir_fd_for(dir_path):
+    """Return a cached O_DIRECTORY fd for dir_path, or None once the cap is hit."""
+    with _dir_fds_lock:
+        fd = _dir_fds.get(dir_path)
+        if fd is None and len(_dir_fds) < MAX_DIR_FDS:
+            try:
+                fd = os.open(dir_path, os.O_RDONLY | os.O_DIRECTORY)
+            except OSError:
+                return None
+            _dir_fds[dir_path] = fd
+    return fd
+
+
+def _close_dir_fds():
+    """Close every cached directory fd."""
+    with _dir_fds_lock:
+        for fd in _dir_fds.values():
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        _dir_fds.clear()
+
+
+# Entries filtered per batch during scanning
+SCAN_BATCH_SIZE = 1024
+
+
+def _filter_batch(batch, cutoff_ns, ext_tuple):
     """
-    Get a list of files to delete based on age and extensions.
-    
-    Args:
-        paths (list): List of paths to scan
-        age_days (int): Files older than this many days will be marked for deletion
-        extensions (list): List of file extensions to target
-        exclude_dirs (list): List of directories to exclude
-        
-    Returns:
-        list: List of files to delete
+    Filter a batch of (dir_fd, DirEntry) pairs down to deletion candidates.
+
+    Returns ((dir_fd, name, path), size) tuples for entries older than
+    cutoff_ns whose name matches ext_tuple. Names are checked before any
+    stat is issued: with a small extension whitelist most entries fail the
+    name test, so most files never cost a syscall at all. With numpy
+    installed the mtime comparison over the survivors runs as one
+    vectorized operation instead of a Python-level branch per file.
     """
-    files_to_delete = []
-    current_time = time.time()
-    age_seconds = age_days * 86400  # Convert days to seconds
-    
-    exclude_dirs = exclude_dirs or []
-    extensions = extensions or []
-    
-    for path in paths:
-        if not os.path.exists(path):
-            logger.warning(f"Path does not exist: {path}")
+    pairs = []
+    mtimes_ns = []
+    for dir_fd, entry in batch:
+        # The name check is free; don't spend a stat on entries that fail it
+        if ext_tuple and not entry.name.endswith(ext_tuple):
             continue
-            
         try:
-            if os.path.isfile(path):
-                file_stats = os.stat(path)
-                if (current_time - file_stats.st_mtime) > age_seconds:
-                    if not extensions or any(path.endswith(ext) for ext in extensions):
-                        files_to_delete.append(path)
-            else:
-                for root, dirs, files in os.walk(path, topdown=True):
-                    # Exclude directories
-                    dirs[:] = [d for d in dirs if os.path.join(root, d) not in exclude_dirs]
-                    
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        if os.path.islink(file_path):
-                            continue
-                            
-                        try:
-                            file_stats = os.stat(file_path)
-                            if (current_time - file_stats.st_mtime) > age_seconds:
-                                if not extensions or any(file.endswith(ext) for ext in extensions):
-                                    files_to_delete.append(file_path)
-                        except (FileNotFoundError, PermissionError) as e:
-                            logger.debug(f"Error accessing file {file_path}: {e}")
-        except (PermissionError, OSError) as e:
-            logger.warning(f"Error accessing path {path}: {e}")
-    
-    return files_to_delete
+            file_stats = entry.stat(follow_symlinks=False)
+        except (FileNotFoundError, PermissionError) as e:
+            logger.debug(f"Error accessing file {entry.path}: {e}")
+            continue
+        if stat.S_ISLNK(file_stats.st_mode):
+            continue
+        pairs.append((dir_fd, entry, file_stats.st_size))
+        mtimes_ns.append(file_stats.st_mtime_ns)
+
+    if np is not None and len(pairs) > 1:
+        mask = np.fromiter(mtimes_ns, dtype=np.int64, count=len(pairs)) < cutoff_ns
+        return [((dir_fd, entry.name, entry.path), size)
+                for keep, (dir_fd, entry, size) in zip(mask, pairs) if keep]
+
+    return [((dir_fd, entry.name, entry.path), size)
+            for mtime_ns, (dir_fd, entry, size) in zip(mtimes_ns, pairs)
+            if mtime_ns < cutoff_ns]
 
 
-def cleanup_files(files_list, dry_run=False):
+# Number of unlink submissions kept in flight per io_uring batch
+URING_BATCH_SIZE = 1024
+
+
+def _uring_cleanup_files(files):
     """
-    Delete files in the provided list.
-    
-    Args:
-        files_list (list): List of files to delete
-        dry_run (bool): If True, only preview files that would be deleted
-        
+    Delete files through io_uring with batched unlinkat submissions.
+
+    Instead of one blocking unlink syscall per file, up to URING_BATCH_SIZE
+    deletions are submitted to the ring at once and completions are reaped
+    together, so the per-file syscall and queue-depth overhead collapses.
+    The input stream is consumed one batch at a time.
+
     Returns:
         tuple: (number of files deleted, total size freed)
     """
     deleted_count = 0
     total_size_freed = 0
-    
-    for file_path in files_list:
+
+    files = iter(files)
+    ring = liburing.io_uring()
+    liburing.io_uring_queue_init(URING_BATCH_SIZE, ring, 0)
+    try:
+        while True:
+            batch = list(islice(files, URING_BATCH_SIZE))
+            if not batch:
+                break
+
+            for index, ((dir_fd, name, file_path), file_size) in enumerate(batch):
+                _drop_page_cache(dir_fd, name, file_path, file_size)
+                sqe = liburing.io_uring_get_sqe(ring)
+                if dir_fd is not None:
+                    liburing.io_uring_prep_unlinkat(sqe, dir_fd, os.fsencode(name), 0)
+                else:
+                    liburing.io_uring_prep_unlinkat(
+                        sqe, liburing.AT_FDCWD, os.fsencode(file_path), 0)
+                sqe.user_data = index
+            liburing.io_uring_submit(ring)
+
+            cqes = liburing.io_uring_cqes()
+            for _ in batch:
+                liburing.io_uring_wait_cqe(ring, cqes)
+                cqe = cqes[0]
+                (_, _, file_path), file_size = batch[cqe.user_data]
+                if cqe.res == 0:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Deleted: {file_path} ({format_size(file_size)})")
+                    _note_deleted(file_size)
+                    deleted_count += 1
+                    total_size_freed += file_size
+                else:
+                    logger.warning(f"Error deleting file {file_path}: "
+                                   f"{os.strerror(-cqe.res)}")
+                liburing.io_uring_cqe_seen(ring, cqe)
+    finally:
+        liburing.io_uring_queue_exit(ring)
+
+    return deleted_count, total_size_freed
+
+
+# Progress summaries replace per-file logging in the deletion hot path
+PROGRESS_EVERY_FILES = 1000
+PROGRESS_EVERY_SECONDS = 1.0
+
+_progress = {"count": 0, "bytes": 0, "last": 0.0}
+_progress_lock = threading.Lock()
+
+
+def _note_deleted(file_size):
+    """
+    Fold one deletion into the shared progress counters.
+
+    A summary line is emitted every PROGRESS_EVERY_FILES deletions or
+    PROGRESS_EVERY_SECONDS seconds, whichever comes first, instead of one
+    log record per file.
+    """
+    with _progress_lock:
+        _progress["count"] += 1
+        _progress["bytes"] += file_size
+        now = time.monotonic()
+        if (_progress["count"] % PROGRESS_EVERY_FILES == 0
+                or now - _progress["last"] >= PROGRESS_EVERY_SECONDS):
+            logger.info(f"Deleted {_progress['count']} files so far "
+                        f"({format_size(_progress['bytes'])} freed)")
+            _progress["last"] = now
+
+
+# Drop page-cache contents of files at least this large before unlinking
+FADVISE_MIN_SIZE = 8 * 1024 * 1024
+
+
+def _drop_page_cache(dir_fd, name, file_path, file_size):
+    """
+    Evict a large file's pages from the page cache before it is unlinked.
+
+    POSIX_FADV_DONTNEED returns the memory immediately instead of leaving
+    it to reclaim - an unprivileged alternative to the root-only
+    drop_caches write in optimize_system, for data this tool is about to
+    remove anyway. Small files are skipped; the extra open isn't worth it.
+    """
+    if file_size < FADVISE_MIN_SIZE or not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        if dir_fd is not None:
+            fd = os.open(name, os.O_RDONLY, dir_fd=dir_fd)
+        else:
+            fd = os.open(file_path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _unlink_one(item):
+    """Delete a single file and return (deleted, size freed) for aggregation."""
+    (dir_fd, name, file_path), file_size = item
+    _drop_page_cache(dir_fd, name, file_path, file_size)
+    try:
+        if dir_fd is not None:
+            # unlinkat: single dentry lookup instead of a full path walk
+            os.unlink(name, dir_fd=dir_fd)
+        else:
+            os.remove(file_path)
+        # Per-file lines are debug-only; the guard skips the format_size
+        # call and the f-string when DEBUG is filtered out
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Deleted: {file_path} ({format_size(file_size)})")
+        _note_deleted(file_size)
+        return 1, file_size
+    except (FileNotFoundError, PermissionError, OSError) as e:
+        logger.warning(f"Error deleting file {file_path}: {e}")
+        return 0, 0
+
+
+def _delete_batch(candidates):
+    """Delete a batch of candidates, preferring the io_uring backend."""
+    if liburing is not None:
         try:
-            file_size = os.path.getsize(file_path)
-            if dry_run:
-                logger.info(f"Would delete: {file_path} ({format_size(file_size)})")
-            else:
-                os.remove(file_path)
-                logger.info(f"Deleted: {file_path} ({format_size(file_size)})")
-                deleted_count += 1
-                total_size_freed += file_size
-        except (FileNotFoundError, PermissionError, OSError) as e:
-            logger.warning(f"Error deleting file {file_path}: {e}")
-    
+            return _uring_cleanup_files(candidates)
+        except Exception as e:
+            logger.debug(f"io_uring backend unavailable, using os.remove: {e}")
+
+    deleted_count = 0
+    total_size_freed = 0
+    for item in candidates:
+        deleted, size = _unlink_one(item)
+        deleted_count += deleted
+        total_size_freed += size
     return deleted_count, total_size_freed
 
 
-def cleanup_empty_dirs(paths, dry_run=False):
+def _scan_and_delete_dir(path, dir_fd, cutoff_ns, ext_tuple, exclude_set,
+                         dry_run, prune_empty):
     """
-    Remove empty directories in the provided paths.
-    
-    Args:
-        paths (list): List of paths to scan for empty directories
-        dry_run (bool): If True, only preview directories that would be deleted
-        
+    Fused pass over one directory and everything below it.
+
+    Files are filtered and deleted in batches as they are scanned, and
+    emptiness is tracked by counting entries as they go by and subtracting
+    each successful removal, so pruning a directory that ends up empty
+    costs no listdir or trial-rmdir syscall - just the rmdir itself,
+    issued against the parent's dirfd.
+
     Returns:
-        int: Number of directories deleted
+        tuple: (files deleted, size freed, dirs deleted, True if the
+            directory is now empty)
     """
     deleted_count = 0
-    
-    for path in paths:
-        if not os.path.exists(path) or not os.path.isdir(path):
-            continue
-            
-        for root, dirs, files in os.walk(path, topdown=False):
-            for dir_name in dirs:
-                dir_path = os.path.join(root, dir_name)
-                try:
-                    if len(os.listdir(dir_path)) == 0:
+    total_size_freed = 0
+    dirs_deleted = 0
+    remaining = 0
+    batch = []
+
+    def flush():
+        nonlocal deleted_count, total_size_freed, remaining
+        if not batch:
+            return
+        candidates = _filter_batch(batch, cutoff_ns, ext_tuple)
+        if dry_run:
+            for (_, _, file_path), file_size in candidates:
+                logger.info(f"Would delete: {file_path} ({format_size(file_size)})")
+            remaining += len(batch)
+        else:
+            deleted, freed = _delete_batch(candidates)
+            deleted_count += deleted
+            total_size_freed += freed
+            remaining += len(batch) - deleted
+        batch.clear()
+
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                # is_dir/is_file with follow_symlinks=False are answered from
+                # the d_type cache and are already False for symlinks, so no
+                # separate is_symlink (lstat) round-trip is needed
+                if entry.is_dir(follow_symlinks=False):
+                    if exclude_set and os.path.realpath(entry.path) in exclude_set:
+                        remaining += 1
+                        continue
+                    sub_count, sub_freed, sub_dirs, now_empty = _scan_and_delete_dir(
+                        entry.path, _dir_fd_for(entry.path), cutoff_ns,
+                        ext_tuple, exclude_set, dry_run, prune_empty)
+                    deleted_count += sub_count
+                    total_size_freed += sub_freed
+                    dirs_deleted += sub_dirs
+                    removed = False
+                    if now_empty and prune_empty:
                         if dry_run:
-                            logger.info(f"Would remove empty directory: {dir_path}")
+                            logger.info(f"Would remove empty directory: {entry.path}")
                         else:
-                            os.rmdir(dir_path)
-                            logger.info(f"Removed empty directory: {dir_path}")
-                            deleted_count += 1
-                except (PermissionError, OSError) as e:
-                    logger.debug(f"Error removing directory {dir_path}: {e}")
-    
-    return deleted_count
+                            try:
+                                if dir_fd is not None:
+                                    os.rmdir(entry.name, dir_fd=dir_fd)
+                                else:
+                                    os.rmdir(entry.path)
+                                logger.info(f"Removed empty directory: {entry.path}")
+                                dirs_deleted += 1
+                                removed = True
+                            except OSError as e:
+                                # EEXIST is what some filesystems report for
+                                # non-empty
+                                if e.errno not in (errno.ENOTEMPTY, errno.EEXIST):
+                                    logger.debug(f"Error removing directory {entry.path}: {e}")
+                    if not removed:
+                        remaining += 1
+                elif entry.is_file(follow_symlinks=False):
+                    batch.append((dir_fd, entry))
+                    if len(batch) >= SCAN_BATCH_SIZE:
+                        flush()
+                else:
+                    remaining += 1
+        flush()
+    except (PermissionError, OSError) as e:
+        logger.debug(f"Error scanning directory {path}: {e}")
+        remaining += 1  # unknown contents; never treat as empty
+
+    return deleted_count, total_size_freed, dirs_deleted, remaining == 0
+
+
+def _scan_and_delete_one(path, current_time, age_seconds, ext_tuple,
+                         exclude_set, dry_run, prune_empty):
+    """
+    Fused scan+delete for one top-level path.
+
+    Returns:
+        tuple: (files deleted, size freed, empty dirs removed)
+    """
+    if not os.path.exists(path):
+        logger.warning(f"Path does not exist: {path}")
+        return 0, 0, 0
+
+    cutoff_ns = int((current_time - age_seconds) * 1e9)
+    try:
+        if os.path.isfile(path):
+            if ext_tuple and not path.endswith(ext_tuple):
+                return 0, 0, 0
+            file_stats = os.stat(path)
+            if file_stats.st_mtime_ns >= cutoff_ns:
+                return 0, 0, 0
+            dir_fd = _dir_fd_for(os.path.dirname(path) or ".")
+            item = ((dir_fd, os.path.basename(path), path), file_stats.st_size)
+            if dry_run:
+                logger.info(f"Would delete: {path} ({format_size(file_stats.st_size)})")
+                return 0, 0, 0
+            deleted, freed = _delete_batch([item])
+            return deleted, freed, 0
+
+        deleted, freed, dirs_deleted, _ = _scan_and_delete_dir(
+            path, _dir_fd_for(path), cutoff_ns, ext_tuple, exclude_set,
+            dry_run, prune_empty)
+        return deleted, freed, dirs_deleted
+    except (PermissionError, OSError) as e:
+        logger.warning(f"Error accessing path {path}: {e}")
+        return 0, 0, 0
+
+
+def scan_and_delete(paths, age_days=7, extensions=None, exclude_dirs=None,
+                    dry_run=False, threads=DEFAULT_THREADS, prune_empty=False):
+    """
+    Scan paths and delete matching files in a single fused pass.
+
+    Matching and unlinking happen inside the same scandir visit, so each
+    file's dentry and inode are touched once while still hot in the kernel
+    caches, instead of being re-resolved by separate collect and delete
+    passes. Each top-level path runs in its own thread (stat, getdents and
+    unlink all release the GIL, so independent roots overlap their
+    metadata latency). With prune_empty, directories left (or found) empty
+    are removed on the way back up, using the child counts tracked during
+    the scan rather than any extra emptiness check.
+
+    Args:
+        paths (list): List of paths to scan
+        age_days (int): Files older than this many days are deleted
+        extensions (list): List of file extensions to target
+        exclude_dirs (list): List of directories to exclude
+        dry_run (bool): If True, only preview files that would be deleted
+        threads (int): Maximum number of concurrently scanned paths
+        prune_empty (bool): If True, remove directories that end up empty
+
+    Returns:
+        tuple: (files deleted, total size freed, empty dirs removed)
+    """
+    current_time = time.time()
+    age_seconds = age_days * 86400  # Convert days to seconds
+
+    # Normalized once: membership checks in the walker are O(1)
+    exclude_set = frozenset(os.path.realpath(p) for p in (exclude_dirs or ()))
+    ext_tuple = tuple(extensions) if extensions else ()
+
+    deleted_count = 0
+    total_size_freed = 0
+    dirs_deleted = 0
+
+    with ThreadPoolExecutor(max_workers=min(threads, max(len(paths), 1))) as executor:
+        futures = [executor.submit(_scan_and_delete_one, path, current_time,
+                                   age_seconds, ext_tuple, exclude_set,
+                                   dry_run, prune_empty)
+                   for path in paths]
+        for future in futures:
+            count, freed, dirs = future.result()
+            deleted_count += count
+            total_size_freed += freed
+            dirs_deleted += dirs
+
+    return deleted_count, total_size_freed, dirs_deleted
+
+
+# Minimum seconds between process-table samples in optimize_system
+MIN_CPU_SAMPLE_INTERVAL = 2.0
+
+_proc_cache = {}
+_last_proc_sample = 0.0
+_last_proc_snapshot = []
+
+
+def _sample_processes():
+    """
+    Snapshot memory and CPU usage of memory-heavy running processes.
+
+    psutil.Process objects are cached across calls so their internal state
+    is reused (cpu_percent is only meaningful against a previous sample),
+    and the whole scan is throttled to one pass per MIN_CPU_SAMPLE_INTERVAL
+    seconds; callers inside that window get the previous snapshot back.
+    """
+    global _last_proc_sample, _last_proc_snapshot
+
+    now = time.monotonic()
+    if _last_proc_snapshot and now - _last_proc_sample < MIN_CPU_SAMPLE_INTERVAL:
+        return _last_proc_snapshot
+
+    snapshot = []
+    pids = set(psutil.pids())
+    for pid in pids:
+        proc = _proc_cache.get(pid)
+        if proc is None:
+            try:
+                proc = psutil.Process(pid)
+            except (psutil.NoSuchProcess, psutil.ZombieProcess):
+                continue
+            _proc_cache[pid] = proc
+        try:
+            memory_usage = proc.memory_info().rss
+            cpu_usage = proc.cpu_percent(interval=None)
+            if memory_usage > 100 * 1024 * 1024:  # More than 100MB
+                snapshot.append({
+                    'pid': pid,
+                    'name': proc.name(),
+                    'memory': memory_usage,
+                    'cpu': cpu_usage
+                })
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            _proc_cache.pop(pid, None)
+
+    # Purge processes that exited since the previous sample
+    for pid in list(_proc_cache):
+        if pid not in pids:
+            del _proc_cache[pid]
+
+    _last_proc_sample = now
+    _last_proc_snapshot = snapshot
+    return snapshot
 
 
 def optimize_system():
@@ -228,33 +611,19 @@ def optimize_system():
     try:
         if os.geteuid() == 0:  # Check if running as root
             logger.info("Clearing system cache...")
-            subprocess.run(["sync"], check=True)
+            os.sync()  # direct sync(2), no fork/exec of /bin/sync
             with open("/proc/sys/vm/drop_caches", "w") as f:
                 f.write("3")
             logger.info("System cache cleared successfully")
         else:
             logger.warning("Skipping system cache clearing (requires root privileges)")
-    except (subprocess.SubprocessError, IOError, PermissionError) as e:
+    except (IOError, PermissionError) as e:
         logger.error(f"Error clearing system cache: {e}")
     
     # Check for memory-intensive processes
-    processes = []
-    for proc in psutil.process_iter(['pid', 'name', 'memory_info', 'cpu_percent']):
-        try:
-            process_info = proc.info
-            memory_usage = process_info['memory_info'].rss
-            cpu_usage = process_info['cpu_percent']
-            
-            if memory_usage > 100 * 1024 * 1024:  # More than 100MB
-                processes.append({
-                    'pid': process_info['pid'],
-                    'name': process_info['name'],
-                    'memory': memory_usage,
-                    'cpu': cpu_usage
-                })
-        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-            pass
-    
+    processes = _sample_processes()
+
+
     # Sort processes by memory usage (descending)
     processes.sort(key=lambda x: x['memory'], reverse=True)
     
@@ -277,6 +646,8 @@ def main():
     parser.add_argument("--age", type=int, default=7, help="Delete files older than specified days (default: 7)")
     parser.add_argument("--threshold", type=int, default=DISK_THRESHOLD, 
                         help=f"Disk space threshold percentage (default: {DISK_THRESHOLD})")
+    parser.add_argument("--threads", type=int, default=DEFAULT_THREADS,
+                        help=f"Number of worker threads (default: {DEFAULT_THREADS})")
     parser.add_argument("--optimize", action="store_true", help="Optimize system performance")
     parser.add_argument("--config", type=str, help="Path to custom configuration file")
     args = parser.parse_args()
@@ -302,50 +673,52 @@ def main():
     
     total_files_deleted = 0
     total_size_freed = 0
-    
-    # Process temporary files
+    dirs_deleted = 0
+
+    # Process temporary files; prune directories the cleanup leaves empty
     logger.info("Processing temporary files...")
-    temp_files = get_files_to_delete(
-        cleanup_paths["temp_files"], 
+    count, size, dirs = scan_and_delete(
+        cleanup_paths["temp_files"],
         age_days=args.age,
-        extensions=TARGET_EXTENSIONS["temp"]
+        extensions=TARGET_EXTENSIONS["temp"],
+        dry_run=args.dry_run,
+        threads=args.threads,
+        prune_empty=True
     )
-    
-    count, size = cleanup_files(temp_files, dry_run=args.dry_run)
     total_files_deleted += count
     total_size_freed += size
-    
+    dirs_deleted += dirs
+
     # Process log files
     logger.info("Processing log files...")
-    log_files = get_files_to_delete(
-        cleanup_paths["log_files"], 
+    count, size, _ = scan_and_delete(
+        cleanup_paths["log_files"],
         age_days=args.age,
-        extensions=TARGET_EXTENSIONS["logs"]
+        extensions=TARGET_EXTENSIONS["logs"],
+        dry_run=args.dry_run,
+        threads=args.threads
     )
-    
-    count, size = cleanup_files(log_files, dry_run=args.dry_run)
     total_files_deleted += count
     total_size_freed += size
-    
-    # Process cache files
+
+    # Process cache files; prune directories the cleanup leaves empty
     logger.info("Processing cache files...")
-    cache_files = get_files_to_delete(
-        cleanup_paths["cache_files"], 
+    count, size, dirs = scan_and_delete(
+        cleanup_paths["cache_files"],
         age_days=args.age,
-        extensions=TARGET_EXTENSIONS["cache"]
+        extensions=TARGET_EXTENSIONS["cache"],
+        dry_run=args.dry_run,
+        threads=args.threads,
+        prune_empty=True
     )
-    
-    count, size = cleanup_files(cache_files, dry_run=args.dry_run)
     total_files_deleted += count
     total_size_freed += size
-    
-    # Clean up empty directories
-    logger.info("Cleaning up empty directories...")
-    dirs_deleted = cleanup_empty_dirs(
-        cleanup_paths["temp_files"] + cleanup_paths["cache_files"],
-        dry_run=args.dry_run
-    )
-    
+    dirs_deleted += dirs
+
+    # Directory fds cached during scanning are no longer needed
+    _close_dir_fds()
+
+
     # Optimize system if requested
     if args.optimize:
         optimize_system()